@@ -11,13 +11,14 @@ from colorama import Fore, Style
 
 class FileHandler:
     @staticmethod
-    def save_results_csv(results_df: pd.DataFrame, filename: Optional[str] = None) -> str:
-        """保存结果到CSV文件"""
+    def save_results_csv(results_df: pd.DataFrame, filename: Optional[str] = None,
+                         directory: Optional[Path] = None) -> str:
+        """保存结果到CSV文件（默认保存到RESULTS_DIR）"""
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"比赛结果_{timestamp}.csv"
 
-        filepath = RESULTS_DIR / filename
+        filepath = (directory or RESULTS_DIR) / filename
 
         try:
             results_df.to_csv(filepath, index=False, encoding='utf-8-sig')
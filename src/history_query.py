@@ -0,0 +1,157 @@
+# 历史结果查询模块
+# history_query.py
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from config import RESULTS_DIR
+from colorama import Fore, Style
+from src.file_handler import FileHandler
+
+SUPPORTED_SUFFIXES = ('.csv', '.xlsx', '.json')
+BASE_COLUMNS = ['名次', '选手姓名', '平均分', '评委人数', '评分时间']
+
+
+class HistoryQuery:
+    """跨比赛历史结果查询
+
+    扫描 RESULTS_DIR 下的所有结果文件，合并为一张长表并建立
+    选手索引与比赛索引。文件按修改时间和大小缓存，仅在文件新增、
+    修改或删除时重新解析，查询本身只在内存中进行。比赛时间取自
+    结果中的“评分时间”列，缺失时才使用文件修改时间。
+    """
+
+    def __init__(self, results_dir: Path = RESULTS_DIR):
+        self.results_dir = results_dir
+        # 文件路径 -> ((修改时间ns, 文件大小), 该文件的结果DataFrame)
+        self._file_cache: Dict[Path, Tuple[Tuple[int, int], pd.DataFrame]] = {}
+        self.records: pd.DataFrame = pd.DataFrame(columns=['比赛'] + BASE_COLUMNS + ['比赛时间'])
+        self.player_index: Dict[str, pd.Index] = {}
+        self.event_index: Dict[str, pd.Index] = {}
+
+    def refresh(self) -> bool:
+        """扫描结果目录，按修改时间和大小更新缓存，返回数据是否有变化"""
+        files = [f for f in self.results_dir.glob("*")
+                 if f.is_file() and f.suffix.lower() in SUPPORTED_SUFFIXES]
+        current = {}
+        for f in files:
+            stat = f.stat()
+            current[f] = (stat.st_mtime_ns, stat.st_size)
+
+        changed = False
+        for removed in set(self._file_cache) - set(current):
+            del self._file_cache[removed]
+            changed = True
+
+        for filepath, signature in current.items():
+            cached = self._file_cache.get(filepath)
+            if cached is not None and cached[0] == signature:
+                continue
+
+            df = FileHandler.load_results(filepath)
+            if df is None or df.empty or not set(BASE_COLUMNS[:3]).issubset(df.columns):
+                # 无法识别的文件也记录签名，避免每次查询都重新解析
+                df = pd.DataFrame(columns=BASE_COLUMNS)
+            mtime = datetime.fromtimestamp(signature[0] / 1e9)
+            self._file_cache[filepath] = (signature, self._normalize(df, filepath, mtime))
+            changed = True
+
+        if changed:
+            self._rebuild_indexes()
+        return changed
+
+    @staticmethod
+    def _normalize(df: pd.DataFrame, filepath: Path, mtime: datetime) -> pd.DataFrame:
+        """只保留通用列，并附加比赛名称和比赛时间"""
+        normalized = df.reindex(columns=BASE_COLUMNS).copy()
+        # 使用完整文件名作为比赛标识，避免同名不同格式的文件被合并
+        normalized.insert(0, '比赛', filepath.name)
+        # 同一场比赛的评分时间相同，取第一个有效值；缺失时退回文件修改时间
+        scored_at = pd.to_datetime(normalized['评分时间'], errors='coerce').dropna()
+        normalized['比赛时间'] = scored_at.iloc[0] if not scored_at.empty else pd.Timestamp(mtime)
+        normalized['名次'] = pd.to_numeric(normalized['名次'], errors='coerce')
+        normalized['平均分'] = pd.to_numeric(normalized['平均分'], errors='coerce')
+        normalized['选手姓名'] = normalized['选手姓名'].astype(str)
+        return normalized
+
+    def _rebuild_indexes(self):
+        """合并所有缓存文件并重建选手、比赛索引"""
+        frames = [df for _, df in self._file_cache.values() if not df.empty]
+        if frames:
+            self.records = pd.concat(frames, ignore_index=True)
+            # 评分时间只精确到秒，加入比赛名称保证同一时刻的比赛顺序稳定
+            self.records.sort_values(['比赛时间', '比赛', '名次'], inplace=True,
+                                     ignore_index=True, kind='stable')
+        else:
+            self.records = pd.DataFrame(columns=['比赛'] + BASE_COLUMNS + ['比赛时间'])
+
+        self.player_index = self.records.groupby('选手姓名', sort=False).groups
+        self.event_index = self.records.groupby('比赛', sort=False).groups
+
+    @staticmethod
+    def _filter_time(df: pd.DataFrame, start: Optional[datetime],
+                     end: Optional[datetime]) -> pd.DataFrame:
+        """按比赛时间过滤（包含起止时间）"""
+        mask = pd.Series(True, index=df.index)
+        if start is not None:
+            mask &= df['比赛时间'] >= start
+        if end is not None:
+            mask &= df['比赛时间'] <= end
+        return df[mask]
+
+    def list_players(self) -> List[str]:
+        """返回所有出现过的选手姓名"""
+        self.refresh()
+        return sorted(self.player_index.keys())
+
+    def player_history(self, name: str, start: Optional[datetime] = None,
+                       end: Optional[datetime] = None) -> pd.DataFrame:
+        """查询某位选手在各场比赛中的名次和平均分"""
+        self.refresh()
+        rows = self.player_index.get(name)
+        if rows is None:
+            return pd.DataFrame(columns=['比赛', '名次', '平均分', '参赛人数', '比赛时间'])
+
+        history = self.records.loc[rows]
+        history = self._filter_time(history, start, end)
+        event_sizes = {event: len(rows) for event, rows in self.event_index.items()}
+        history = history.assign(参赛人数=history['比赛'].map(event_sizes))
+        return history[['比赛', '名次', '平均分', '参赛人数', '比赛时间']].reset_index(drop=True)
+
+    def event_summary(self, start: Optional[datetime] = None,
+                      end: Optional[datetime] = None) -> pd.DataFrame:
+        """按比赛统计参赛人数、平均分、最高分和最低分"""
+        self.refresh()
+        records = self._filter_time(self.records, start, end)
+        summary = records.groupby('比赛', sort=False).agg(
+            参赛人数=('选手姓名', 'size'),
+            平均分=('平均分', 'mean'),
+            最高分=('平均分', 'max'),
+            最低分=('平均分', 'min'),
+            比赛时间=('比赛时间', 'first'),
+        )
+        return summary.round({'平均分': 2, '最高分': 2, '最低分': 2})
+
+    def player_summary(self, start: Optional[datetime] = None,
+                       end: Optional[datetime] = None) -> pd.DataFrame:
+        """按选手统计参赛次数、平均名次、平均分和最好名次"""
+        self.refresh()
+        records = self._filter_time(self.records, start, end)
+        summary = records.groupby('选手姓名').agg(
+            参赛次数=('比赛', 'nunique'),
+            平均名次=('名次', 'mean'),
+            最好名次=('名次', 'min'),
+            平均分=('平均分', 'mean'),
+        )
+        return summary.sort_values(['平均分', '参赛次数'], ascending=False).round(2)
+
+    @staticmethod
+    def print_table(df: pd.DataFrame, title: str, index: bool = False):
+        """打印查询结果"""
+        print(f"\n{Fore.CYAN}{'=' * 60}")
+        print(f"{title}")
+        print(f"{'=' * 60}{Style.RESET_ALL}")
+        if df.empty:
+            print(f"{Fore.YELLOW}没有符合条件的记录{Style.RESET_ALL}")
+        else:
+            print(df.to_string(index=index))
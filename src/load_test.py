@@ -0,0 +1,329 @@
+# 压力测试模块
+# load_test.py
+import sys
+import os
+import io
+import time
+import argparse
+import tempfile
+import threading
+import contextlib
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from colorama import Fore, Style, init
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import MIN_JUDGES, MAX_JUDGES, MIN_PLAYERS, MAX_PLAYERS, MIN_SCORE, MAX_SCORE
+from src.main import CompetitionApp
+from src.user_auth import UserAuth
+
+# 初始化colorama
+init(autoreset=True)
+
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "admin789"
+DISTRIBUTIONS = ("uniform", "normal", "skewed")
+STAGES = ["管理员登录", "创建评委账号", "设置评委", "设置选手", "评委登录", "评委评分", "计算排名", "保存结果"]
+
+
+@dataclass
+class SyntheticEvent:
+    name: str
+    judges: List[str]
+    players: List[str]
+    scores: np.ndarray  # 形状为 (评委人数, 选手人数)
+
+
+def generate_scores(num_judges: int, num_players: int, distribution: str,
+                    rng: np.random.Generator) -> np.ndarray:
+    """按指定分布生成评分矩阵，保留一位小数"""
+    span = MAX_SCORE - MIN_SCORE
+    size = (num_judges, num_players)
+
+    if distribution == "uniform":
+        scores = rng.uniform(MIN_SCORE, MAX_SCORE, size)
+    elif distribution == "normal":
+        # 以选手水平为均值，评委之间存在少量偏差
+        skill = rng.normal(MIN_SCORE + span * 0.75, span * 0.1, num_players)
+        scores = skill + rng.normal(0, span * 0.05, size)
+    elif distribution == "skewed":
+        scores = MIN_SCORE + rng.beta(5, 2, size) * span
+    else:
+        raise ValueError(f"不支持的分布: {distribution}")
+
+    return np.round(np.clip(scores, MIN_SCORE, MAX_SCORE), 1)
+
+
+def generate_event(index: int, num_judges: int, num_players: int, distribution: str,
+                   rng: np.random.Generator) -> SyntheticEvent:
+    """生成一场模拟比赛"""
+    return SyntheticEvent(
+        name=f"压测比赛{index:04d}",
+        judges=[f"压测评委{index:04d}_{j + 1}" for j in range(num_judges)],
+        players=[f"选手{p + 1:03d}" for p in range(num_players)],
+        scores=generate_scores(num_judges, num_players, distribution, rng),
+    )
+
+
+@dataclass
+class StageFailure:
+    event: str
+    stage: str
+    reason: str
+    judge_id: Optional[int] = None
+
+    def __str__(self):
+        judge = f" 评委{self.judge_id}" if self.judge_id is not None else ""
+        return f"{self.event} [{self.stage}{judge}]: {self.reason}"
+
+
+class StageFailed(Exception):
+    """阶段执行失败，失败原因已记录到 StageTimer"""
+
+
+class StageTimer:
+    """线程安全的分阶段耗时和失败记录"""
+
+    def __init__(self):
+        # 阶段 -> 每次执行的 (开始时间, 结束时间)
+        self.intervals: Dict[str, List[Tuple[float, float]]] = {stage: [] for stage in STAGES}
+        self.failures: List[StageFailure] = []
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def measure(self, stage: str, event: str, judge_id: Optional[int] = None):
+        """记录一次阶段执行；抛出异常时同样记录耗时，记录失败原因后抛出 StageFailed"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.fail(stage, event, f"执行出错: {e!r}", judge_id)
+            raise StageFailed() from e
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.intervals[stage].append((start, end))
+
+    def fail(self, stage: str, event: str, reason: str, judge_id: Optional[int] = None):
+        with self._lock:
+            self.failures.append(StageFailure(event, stage, reason, judge_id))
+
+    @staticmethod
+    def busy_time(intervals: List[Tuple[float, float]]) -> float:
+        """计算阶段忙碌时间：所有执行区间合并后的总长度（并发重叠部分只计一次）"""
+        total = 0.0
+        current_start, current_end = None, None
+        for start, end in sorted(intervals):
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    total += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            total += current_end - current_start
+        return total
+
+    def report(self) -> pd.DataFrame:
+        """汇总各阶段吞吐量和延迟
+
+        吞吐量 = 执行次数 / 阶段忙碌时间，即该阶段至少有一个执行在进行中的
+        时间总和，不包含其他阶段占用的时间。
+        """
+        failure_counts = {stage: 0 for stage in STAGES}
+        for failure in self.failures:
+            failure_counts[failure.stage] = failure_counts.get(failure.stage, 0) + 1
+
+        rows = []
+        for stage in STAGES:
+            intervals = self.intervals[stage]
+            if not intervals:
+                continue
+            samples = np.array([end - start for start, end in intervals]) * 1000
+            busy = self.busy_time(intervals)
+            rows.append({
+                '阶段': stage,
+                '次数': samples.size,
+                '失败': failure_counts[stage],
+                '吞吐(次/秒,忙碌时间)': samples.size / busy if busy > 0 else float('inf'),
+                '平均(ms)': samples.mean(),
+                'P50(ms)': np.percentile(samples, 50),
+                'P95(ms)': np.percentile(samples, 95),
+                '最大(ms)': samples.max(),
+            })
+        return pd.DataFrame(rows).round(2)
+
+
+class LoadTester:
+    """以编程方式驱动 CompetitionApp 的完整流程
+
+    每场比赛依次执行：管理员登录、创建评委账号、设置评委、设置选手、
+    各评委并发登录并提交评分、计算排名、保存结果。登录阶段包含 UserAuth
+    的构造（读取用户文件）和密码校验；创建评委账号是压测准备工作，单独
+    计时，不计入设置评委。应用使用注入的 UserAuth，用户数据和结果文件都
+    写入独立的输出目录，不影响正式数据。
+    """
+
+    def __init__(self, output_dir: Path, judge_workers: Optional[int] = None):
+        self.output_dir = output_dir
+        self.judge_workers = judge_workers
+        self.timer = StageTimer()
+        # 用户数据单独存放，避免与结果文件混在一起
+        (output_dir / "users").mkdir(parents=True, exist_ok=True)
+
+    def check(self, ok: bool, stage: str, event: SyntheticEvent, reason: str,
+              judge_id: Optional[int] = None):
+        """阶段返回失败时记录原因并中止该场比赛"""
+        if not ok:
+            self.timer.fail(stage, event.name, reason, judge_id)
+            raise StageFailed()
+
+    def judge_session(self, app: CompetitionApp, users_file: Path, event: SyntheticEvent,
+                      judge_id: int):
+        """模拟单个评委会话：登录后提交对全部选手的评分"""
+        username = event.judges[judge_id - 1]
+        with self.timer.measure("评委登录", event.name, judge_id):
+            ok = UserAuth(users_file=users_file).login(username, username)
+        self.check(ok, "评委登录", event, f"用户名或密码错误: {username}", judge_id)
+
+        with self.timer.measure("评委评分", event.name, judge_id):
+            ok = app.scoring_system.submit_judge_scores(judge_id, event.scores[judge_id - 1].tolist())
+        self.check(ok, "评委评分", event, "评分被拒绝（评委编号、分数个数或分数范围无效）", judge_id)
+
+    def run_event(self, event: SyntheticEvent):
+        """执行一场比赛的完整流程，失败时抛出 StageFailed"""
+        users_file = self.output_dir / "users" / f"{event.name}.json"
+
+        with self.timer.measure("管理员登录", event.name):
+            auth = UserAuth(users_file=users_file)
+            ok = auth.login(ADMIN_USERNAME, ADMIN_PASSWORD)
+        self.check(ok, "管理员登录", event, f"用户名或密码错误: {ADMIN_USERNAME}")
+        app = CompetitionApp(auth=auth)
+
+        with self.timer.measure("创建评委账号", event.name):
+            # 评委账号密码与用户名相同，仅用于压测
+            failed = [name for name in event.judges if not app.auth.add_user(name, name, "judge")]
+        self.check(not failed, "创建评委账号", event, f"账号已存在或无法保存: {', '.join(failed)}")
+
+        with self.timer.measure("设置评委", event.name):
+            ok = app.scoring_system.set_judges(event.judges)
+        self.check(ok, "设置评委", event, f"评委人数或姓名无效（{len(event.judges)}人）")
+
+        with self.timer.measure("设置选手", event.name):
+            ok = app.scoring_system.set_players(event.players)
+        self.check(ok, "设置选手", event, f"选手人数或姓名无效（{len(event.players)}人）")
+
+        workers = self.judge_workers or len(event.judges)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.judge_session, app, users_file, event, judge.id)
+                       for judge in app.scoring_system.judges]
+        # 等待全部评委会话结束，每个会话的失败都已单独记录
+        if any(future.exception() is not None for future in futures):
+            raise StageFailed()
+        self.check(app.scoring_system.scoring_complete, "评委评分", event, "评委已全部提交但评分未完成")
+
+        with self.timer.measure("计算排名", event.name):
+            results_df = app.scoring_system.get_results_dataframe()
+
+        with self.timer.measure("保存结果", event.name):
+            saved_path = app.file_handler.save_results_csv(results_df, f"{event.name}.csv",
+                                                           directory=self.output_dir)
+        self.check(bool(saved_path), "保存结果", event, "写入CSV文件失败")
+
+    def run_event_safely(self, event: SyntheticEvent) -> bool:
+        """执行一场比赛，失败只计入该场，不中断整个压测"""
+        try:
+            self.run_event(event)
+            return True
+        except StageFailed:
+            return False
+        except Exception as e:
+            self.timer.fail("未计时步骤", event.name, f"执行出错: {e!r}")
+            return False
+
+    def run(self, events: List[SyntheticEvent], concurrency: int = 1):
+        """并发执行多场比赛，返回 (成功场数, 总耗时, 分阶段报告, 失败记录)"""
+        start = time.perf_counter()
+        # 保存结果等步骤会打印提示信息，压测期间屏蔽输出；失败原因由 StageTimer 记录
+        with contextlib.redirect_stdout(io.StringIO()):
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = list(executor.map(self.run_event_safely, events))
+        wall_time = time.perf_counter() - start
+        return sum(results), wall_time, self.timer.report(), list(self.timer.failures)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="比赛评分系统压力测试")
+    parser.add_argument("--events", type=int, default=10, help="模拟比赛场数")
+    parser.add_argument("--judges", type=int, default=MAX_JUDGES,
+                        help=f"每场评委人数 ({MIN_JUDGES}-{MAX_JUDGES})")
+    parser.add_argument("--players", type=int, default=MAX_PLAYERS,
+                        help=f"每场选手人数 ({MIN_PLAYERS}-{MAX_PLAYERS})")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="normal", help="评分分布")
+    parser.add_argument("--concurrency", type=int, default=4, help="同时进行的比赛场数")
+    parser.add_argument("--judge-workers", type=int, default=None,
+                        help="每场比赛并发评委会话数（默认等于评委人数）")
+    parser.add_argument("--seed", type=int, default=None, help="随机种子")
+    parser.add_argument("--output-dir", type=Path, default=None,
+                        help="保留压测数据的目录（默认使用临时目录并在结束后删除）")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """主函数"""
+    args = parse_args(argv)
+
+    if not (MIN_JUDGES <= args.judges <= MAX_JUDGES):
+        print(f"{Fore.RED}评委人数必须在{MIN_JUDGES}到{MAX_JUDGES}之间！{Style.RESET_ALL}")
+        return 1
+    if not (MIN_PLAYERS <= args.players <= MAX_PLAYERS):
+        print(f"{Fore.RED}选手人数必须在{MIN_PLAYERS}到{MAX_PLAYERS}之间！{Style.RESET_ALL}")
+        return 1
+    if args.events < 1 or args.concurrency < 1:
+        print(f"{Fore.RED}比赛场数和并发数必须大于0！{Style.RESET_ALL}")
+        return 1
+    if args.judge_workers is not None and args.judge_workers < 1:
+        print(f"{Fore.RED}评委会话并发数必须大于0！{Style.RESET_ALL}")
+        return 1
+
+    rng = np.random.default_rng(args.seed)
+    events = [generate_event(i + 1, args.judges, args.players, args.distribution, rng)
+              for i in range(args.events)]
+
+    with contextlib.ExitStack() as stack:
+        if args.output_dir is None:
+            output_dir = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        else:
+            output_dir = args.output_dir
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+        tester = LoadTester(output_dir, judge_workers=args.judge_workers)
+        succeeded, wall_time, report, failures = tester.run(events, concurrency=args.concurrency)
+
+    print(f"\n{Fore.CYAN}{'=' * 80}")
+    print(f"{' ' * 30}压力测试结果")
+    print(f"{'=' * 80}{Style.RESET_ALL}")
+    print(f"比赛场数: {len(events)}  评委: {args.judges}  选手: {args.players}  "
+          f"分布: {args.distribution}  并发: {args.concurrency}")
+    print(f"成功: {succeeded}/{len(events)}  总耗时: {wall_time:.2f}秒  "
+          f"比赛吞吐: {len(events) / wall_time:.2f}场/秒")
+    print(f"{'-' * 80}")
+    print(report.to_string(index=False))
+    print(f"{'=' * 80}")
+
+    if succeeded < len(events):
+        print(f"\n{Fore.RED}失败详情:{Style.RESET_ALL}")
+        for failure in failures:
+            print(f"  {failure}")
+
+    return 0 if succeeded == len(events) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,8 @@
 # main.py
 import sys
 import os
+from datetime import datetime, time
+from typing import Optional
 from colorama import Fore, Style, init
 
 # 添加项目根目录到Python路径
@@ -10,6 +12,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.user_auth import UserAuth
 from src.scoring_system import ScoringSystem
 from src.file_handler import FileHandler
+from src.history_query import HistoryQuery
 from src.utils import print_header, print_menu, get_valid_input, confirm_action
 
 # 初始化colorama
@@ -17,10 +20,11 @@ init(autoreset=True)
 
 
 class CompetitionApp:
-    def __init__(self):
-        self.auth = UserAuth()
+    def __init__(self, auth: Optional[UserAuth] = None):
+        self.auth = auth if auth is not None else UserAuth()
         self.scoring_system = ScoringSystem()
         self.file_handler = FileHandler()
+        self.history_query = HistoryQuery()
         self.running = True
 
     def main_menu(self):
@@ -36,13 +40,14 @@ class CompetitionApp:
                 "5": "保存结果到文件",
                 "6": "查看历史结果",
                 "7": "用户管理",
-                "8": "退出系统"
+                "8": "退出系统",
+                "9": "历史数据查询"
             }
 
             print_menu(menu_options)
             print(f"{'-' * 60}")
 
-            choice = input(f"请选择操作 ({Fore.GREEN}1-8{Style.RESET_ALL}): ").strip()
+            choice = input(f"请选择操作 ({Fore.GREEN}1-9{Style.RESET_ALL}): ").strip()
 
             if choice == "1":
                 self.setup_judges()
@@ -60,6 +65,8 @@ class CompetitionApp:
                 self.user_management()
             elif choice == "8":
                 self.exit_system()
+            elif choice == "9":
+                self.query_history()
             else:
                 print(f"{Fore.RED}无效选择，请重新输入！{Style.RESET_ALL}")
 
@@ -126,6 +133,66 @@ class CompetitionApp:
 
         input(f"\n按{Fore.GREEN}Enter{Style.RESET_ALL}键继续...")
 
+    def query_history(self):
+        """跨比赛历史数据查询"""
+        print_header("历史数据查询")
+
+        query_options = {
+            "1": "查询选手历史成绩",
+            "2": "各场比赛统计",
+            "3": "选手综合统计",
+            "4": "返回主菜单"
+        }
+
+        print_menu(query_options)
+
+        choice = input(f"请选择操作 ({Fore.GREEN}1-4{Style.RESET_ALL}): ").strip()
+
+        if choice == "1":
+            players = self.history_query.list_players()
+            if not players:
+                print(f"{Fore.YELLOW}暂无历史结果数据{Style.RESET_ALL}")
+            else:
+                name = get_valid_input("输入选手姓名: ")
+                start, end = self.prompt_date_range()
+                df = self.history_query.player_history(name, start, end)
+                self.history_query.print_table(df, f"选手历史成绩: {name}")
+
+        elif choice == "2":
+            start, end = self.prompt_date_range()
+            df = self.history_query.event_summary(start, end)
+            self.history_query.print_table(df, "各场比赛统计", index=True)
+
+        elif choice == "3":
+            start, end = self.prompt_date_range()
+            df = self.history_query.player_summary(start, end)
+            self.history_query.print_table(df, "选手综合统计", index=True)
+
+        input(f"\n按{Fore.GREEN}Enter{Style.RESET_ALL}键继续...")
+
+    @staticmethod
+    def prompt_date_range():
+        """输入可选的日期范围（YYYY-MM-DD，留空表示不限）"""
+        while True:
+            dates = []
+            for label, day_time in (("开始", time.min), ("结束", time.max)):
+                while True:
+                    text = get_valid_input(f"输入{label}日期 (YYYY-MM-DD，留空不限): ", allow_empty=True)
+                    if not text:
+                        dates.append(None)
+                        break
+                    try:
+                        dates.append(datetime.combine(datetime.strptime(text, "%Y-%m-%d").date(), day_time))
+                        break
+                    except ValueError:
+                        print(f"{Fore.RED}日期格式错误，请按YYYY-MM-DD输入！{Style.RESET_ALL}")
+
+            start, end = dates
+            if start is not None and end is not None and start > end:
+                print(f"{Fore.RED}开始日期不能晚于结束日期，请重新输入！{Style.RESET_ALL}")
+                continue
+            return start, end
+
     def user_management(self):
         """用户管理（仅管理员）"""
         if self.auth.current_user != "admin":
@@ -1,12 +1,13 @@
 # 评分系统核心类
 # scoring_system.py
+import threading
 import numpy as np
 import pandas as pd
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from colorama import Fore, Style
-from config import MIN_JUDGES, MAX_JUDGES, MIN_PLAYERS, MAX_PLAYERS
+from config import MIN_JUDGES, MAX_JUDGES, MIN_PLAYERS, MAX_PLAYERS, MIN_SCORE, MAX_SCORE
 
 
 @dataclass
@@ -28,6 +29,54 @@ class ScoringSystem:
         self.judges: List[Judge] = []
         self.players: List[Player] = []
         self.scoring_complete: bool = False
+        # 评委ID -> 该评委对全部选手的评分（按选手顺序），用于并发提交
+        self._pending_scores: Dict[int, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def set_judges(self, names: List[str]) -> bool:
+        """非交互式设置评委"""
+        names = [name.strip() for name in names]
+        if not (MIN_JUDGES <= len(names) <= MAX_JUDGES) or not all(names):
+            return False
+
+        self.judges = [Judge(name=name, id=i + 1) for i, name in enumerate(names)]
+        self._pending_scores.clear()
+        self.scoring_complete = False
+        return True
+
+    def set_players(self, names: List[str]) -> bool:
+        """非交互式设置选手"""
+        names = [name.strip() for name in names]
+        if not (MIN_PLAYERS <= len(names) <= MAX_PLAYERS) or not all(names):
+            return False
+
+        self.players = [Player(name=name, scores=[]) for name in names]
+        self._pending_scores.clear()
+        self.scoring_complete = False
+        return True
+
+    def submit_judge_scores(self, judge_id: int, scores: List[float]) -> bool:
+        """提交某位评委对全部选手的评分（线程安全）
+
+        所有评委提交后按评委顺序汇总到选手分数中，并标记评分完成。
+        """
+        if not self.judges or not self.players:
+            return False
+        if not (1 <= judge_id <= len(self.judges)) or len(scores) != len(self.players):
+            return False
+        if not all(MIN_SCORE <= score <= MAX_SCORE for score in scores):
+            return False
+
+        with self._lock:
+            self._pending_scores[judge_id] = [float(score) for score in scores]
+
+            if len(self._pending_scores) == len(self.judges):
+                for i, player in enumerate(self.players):
+                    player.scores = [self._pending_scores[judge.id][i] for judge in self.judges]
+                self._pending_scores.clear()
+                self.scoring_complete = True
+
+        return True
 
     def setup_judges(self) -> bool:
         """设置评委信息"""
@@ -45,16 +94,19 @@ class ScoringSystem:
             print(f"{Fore.RED}请输入有效的数字！{Style.RESET_ALL}")
             return False
 
-        self.judges.clear()
+        names = []
         for i in range(num_judges):
             while True:
                 name = input(f"请输入第{i + 1}位评委姓名: ").strip()
                 if name:
-                    self.judges.append(Judge(name=name, id=i + 1))
+                    names.append(name)
                     break
                 else:
                     print(f"{Fore.RED}评委姓名不能为空！{Style.RESET_ALL}")
 
+        if not self.set_judges(names):
+            return False
+
         print(f"\n{Fore.GREEN}已成功设置 {len(self.judges)} 位评委:{Style.RESET_ALL}")
         for judge in self.judges:
             print(f"  评委{judge.id}: {judge.name}")
@@ -77,16 +129,19 @@ class ScoringSystem:
             print(f"{Fore.RED}请输入有效的数字！{Style.RESET_ALL}")
             return False
 
-        self.players.clear()
+        names = []
         for i in range(num_players):
             while True:
                 name = input(f"请输入第{i + 1}位选手姓名: ").strip()
                 if name:
-                    self.players.append(Player(name=name, scores=[]))
+                    names.append(name)
                     break
                 else:
                     print(f"{Fore.RED}选手姓名不能为空！{Style.RESET_ALL}")
 
+        if not self.set_players(names):
+            return False
+
         print(f"\n{Fore.GREEN}已成功设置 {len(self.players)} 位选手:{Style.RESET_ALL}")
         for i, player in enumerate(self.players, 1):
             print(f"  选手{i}: {player.name}")
@@ -107,32 +162,38 @@ class ScoringSystem:
             print(f"{Fore.RED}请先设置选手信息！{Style.RESET_ALL}")
             return False
 
-        # 初始化所有选手的分数列表
-        for player in self.players:
-            player.scores = []
+        # 清除未完成的评分，按评委汇总本轮输入
+        with self._lock:
+            self._pending_scores.clear()
+            self.scoring_complete = False
+        judge_scores: Dict[int, List[float]] = {judge.id: [] for judge in self.judges}
 
         # 为每位选手收集评委评分
         for i, player in enumerate(self.players, 1):
             print(f"\n{Fore.YELLOW}为选手 {player.name} 评分 ({i}/{len(self.players)}){Style.RESET_ALL}")
 
+            player_scores = []
             for judge in self.judges:
                 while True:
                     try:
-                        score_input = input(f"  请 {judge.name} 评委为 {player.name} 打分 (0-100): ")
+                        score_input = input(f"  请 {judge.name} 评委为 {player.name} 打分 ({MIN_SCORE}-{MAX_SCORE}): ")
                         score = float(score_input)
 
-                        if 0 <= score <= 100:
-                            player.scores.append(score)
+                        if MIN_SCORE <= score <= MAX_SCORE:
+                            player_scores.append(score)
+                            judge_scores[judge.id].append(score)
                             break
                         else:
-                            print(f"{Fore.RED}  分数必须在0-100之间！{Style.RESET_ALL}")
+                            print(f"{Fore.RED}  分数必须在{MIN_SCORE}-{MAX_SCORE}之间！{Style.RESET_ALL}")
                     except ValueError:
                         print(f"{Fore.RED}  请输入有效的数字！{Style.RESET_ALL}")
 
-            print(f"  {Fore.BLUE}{player.name} 的评分: {player.scores}{Style.RESET_ALL}")
+            print(f"  {Fore.BLUE}{player.name} 的评分: {player_scores}{Style.RESET_ALL}")
 
-        self.scoring_complete = True
-        return True
+        for judge in self.judges:
+            self.submit_judge_scores(judge.id, judge_scores[judge.id])
+
+        return self.scoring_complete
 
     def calculate_average_scores(self):
         """计算平均分（去掉最高分和最低分）"""
@@ -11,7 +11,8 @@ init(autoreset=True)
 
 
 class UserAuth:
-    def __init__(self):
+    def __init__(self, users_file: Path = USERS_FILE):
+        self.users_file = users_file
         self.users = self.load_users()
         self.current_user = None
         self.login_attempts = 0
@@ -23,9 +24,9 @@ class UserAuth:
 
     def load_users(self):
         """从文件加载用户数据"""
-        if USERS_FILE.exists():
+        if self.users_file.exists():
             try:
-                with open(USERS_FILE, 'r', encoding='utf-8') as f:
+                with open(self.users_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
             except (json.JSONDecodeError, IOError):
                 return self.create_default_users()
@@ -59,7 +60,7 @@ class UserAuth:
             users_data = self.users
 
         try:
-            with open(USERS_FILE, 'w', encoding='utf-8') as f:
+            with open(self.users_file, 'w', encoding='utf-8') as f:
                 json.dump(users_data, f, indent=2, ensure_ascii=False)
             return True
         except IOError:
@@ -76,8 +77,7 @@ class UserAuth:
             username = input(f"{Fore.GREEN}用户名: {Style.RESET_ALL}").strip()
             password = input(f"{Fore.GREEN}密码: {Style.RESET_ALL}").strip()
 
-            if self.validate_credentials(username, password):
-                self.current_user = username
+            if self.login(username, password):
                 role = self.users[username]["role"]
                 print(f"\n{Fore.GREEN}登录成功！欢迎{role}: {username}{Style.RESET_ALL}")
                 return True
@@ -88,6 +88,13 @@ class UserAuth:
         print(f"\n{Fore.RED}错误次数超过限制，系统退出！{Style.RESET_ALL}")
         return False
 
+    def login(self, username, password):
+        """非交互式登录，成功时设置当前用户"""
+        if self.validate_credentials(username, password):
+            self.current_user = username
+            return True
+        return False
+
     def validate_credentials(self, username, password):
         """验证用户凭据"""
         if username in self.users: